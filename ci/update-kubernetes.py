@@ -2,10 +2,15 @@
 
 # SPDX-FileCopyrightText: Copyright (c) 2024-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
+import gzip
+import hashlib
 import json
 import os
 import re
+import tempfile
+import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -16,133 +21,150 @@ yaml.width = 2**16
 yaml.preserve_quotes = True
 yaml.indent(mapping=2, sequence=4, offset=2)
 
-DATE_FORMAT = "%Y-%m-%d"
+KIND_TAGS_URL = "https://hub.docker.com/v2/repositories/kindest/node/tags"
+KIND_TAGS_PAGE_SIZE = 100
+KIND_TAG_RE = re.compile(r"v(\d+\.\d+)\.")
+BADGE_RE = re.compile(r"img\.shields\.io/badge/Kubernetes%20support.*-blue")
+CACHE_DIR = Path.home() / ".cache" / "kr8s-update-kubernetes"
+CACHE_TTL = 60 * 60
+
+
+def fetch_json(url):
+    # Cache responses on disk so repeated runs within the TTL skip the network
+    cache_file = CACHE_DIR / hashlib.blake2b(url.encode()).hexdigest()
+    if cache_file.exists() and time.time() - cache_file.stat().st_mtime < CACHE_TTL:
+        return json.loads(cache_file.read_bytes())
+
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+    with urllib.request.urlopen(request) as response:
+        body = response.read()
+        if response.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+    data = json.loads(body)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Pages are fetched from several threads, so never leave a half written file
+    # where another run could read it
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as fh:
+        fh.write(body)
+    os.replace(fh.name, cache_file)
+    return data
+
+
+def parse_eol_rows(data, fields=None):
+    fields = fields or {}
+    now = datetime.now()
+    rows = []
+    for x in data:
+        eol = datetime.fromisoformat(x["eol"])
+        if eol > now:
+            rows.append(
+                {
+                    "cycle": x["cycle"],
+                    **{key: x[field] for key, field in fields.items()},
+                    "eol": eol,
+                }
+            )
+    rows.sort(key=lambda x: x["eol"], reverse=True)
+    return rows
 
 
 def get_kubernetes_oss_versions():
     print(
         "Loading Kubernetes versions from https://endoflife.date/api/kubernetes.json..."
     )
-    with urllib.request.urlopen("https://endoflife.date/api/kubernetes.json") as url:
-        data = json.load(url)
-        data = [
-            {
-                "cycle": x["cycle"],
-                "latest_version": x["latest"],
-                "eol": datetime.strptime(x["eol"], DATE_FORMAT),
-            }
-            for x in data
-            if datetime.strptime(x["eol"], DATE_FORMAT) > datetime.now()
-        ]
-        data.sort(key=lambda x: x["eol"], reverse=True)
-    return data
+    data = fetch_json("https://endoflife.date/api/kubernetes.json")
+    return parse_eol_rows(data, fields={"latest_version": "latest"})
 
 
 def get_azure_aks_versions():
     url = "https://endoflife.date/api/azure-kubernetes-service.json"
     print(f"Loading Azure AKS versions from {url}...")
-    with urllib.request.urlopen(url) as payload:
-        data = json.load(payload)
-
-        # Workaround for https://github.com/kr8s-org/kr8s/issues/514
-        # Ensure that the `eol` date is the original date and the`lts` date is the extended date.
-        for x in data:
-            if "lts" in x and x["lts"]:
-                x["eol"], x["lts"] = sorted([x["eol"], x["lts"]])
-
-        data = [
-            {
-                "cycle": x["cycle"],
-                "eol": datetime.strptime(x["eol"], DATE_FORMAT),
-            }
-            for x in data
-            if datetime.strptime(x["eol"], DATE_FORMAT) > datetime.now()
-        ]
-        data.sort(key=lambda x: x["eol"], reverse=True)
-    return data
+    data = fetch_json(url)
+
+    # Workaround for https://github.com/kr8s-org/kr8s/issues/514
+    # Ensure that the `eol` date is the original date and the`lts` date is the extended date.
+    for x in data:
+        if "lts" in x and x["lts"]:
+            x["eol"], x["lts"] = sorted([x["eol"], x["lts"]])
+
+    return parse_eol_rows(data)
 
 
 def get_amazon_eks_versions():
     url = "https://endoflife.date/api/amazon-eks.json"
     print(f"Loading Amazon EKS versions from {url}...")
-    with urllib.request.urlopen(url) as payload:
-        data = json.load(payload)
-        data = [
-            {
-                "cycle": x["cycle"],
-                "eol": datetime.strptime(x["eol"], DATE_FORMAT),
-            }
-            for x in data
-            if datetime.strptime(x["eol"], DATE_FORMAT) > datetime.now()
-        ]
-        data.sort(key=lambda x: x["eol"], reverse=True)
-    return data
+    data = fetch_json(url)
+    return parse_eol_rows(data)
 
 
 def get_google_kubernetes_engine_versions():
     url = "https://endoflife.date/api/google-kubernetes-engine.json"
     print(f"Loading Google Kubernetes Engine versions from {url}...")
-    with urllib.request.urlopen(url) as payload:
-        data = json.load(payload)
-        data = [
-            {
-                "cycle": x["cycle"],
-                "eol": datetime.strptime(x["eol"], DATE_FORMAT),
-            }
-            for x in data
-            if datetime.strptime(x["eol"], DATE_FORMAT) > datetime.now()
-        ]
-        data.sort(key=lambda x: x["eol"], reverse=True)
-    return data
+    data = fetch_json(url)
+    return parse_eol_rows(data)
 
 
 def extend_versions(versions, extended_versions, provider):
     print(f"Extending EOL dates with {provider} support dates...")
+    versions_by_cycle = {version["cycle"]: version for version in versions}
     for extended_version in extended_versions:
-        for version in versions:
-            if version["cycle"] == extended_version["cycle"]:
-                if version["eol"] < extended_version["eol"]:
-                    print(
-                        f"Extending EOL date for {version['cycle']} from {version['eol']:%Y-%m-%d} to "
-                        f"{provider} support date {extended_version['eol']:%Y-%m-%d}"
-                    )
-                    version["eol"] = extended_version["eol"]
+        version = versions_by_cycle.get(extended_version["cycle"])
+        if version and version["eol"] < extended_version["eol"]:
+            print(
+                f"Extending EOL date for {version['cycle']} from {version['eol']:%Y-%m-%d} to "
+                f"{provider} support date {extended_version['eol']:%Y-%m-%d}"
+            )
+            version["eol"] = extended_version["eol"]
     return versions
 
 
 def get_kind_versions():
     print("Loading Kubernetes tags from https://hub.docker.com/r/kindest/node/tags...")
-    container_tags = []
-    next_url = "https://hub.docker.com/v2/repositories/kindest/node/tags"
-    while next_url:
-        with urllib.request.urlopen(next_url) as url:
-            results = json.load(url)
-            container_tags += results["results"]
-            if "next" in results and results["next"]:
-                next_url = results["next"]
-            else:
-                next_url = None
+    # Fetch the first page to find out how many tags there are, then fetch the
+    # remaining pages concurrently. Pages are kept in order so newer tags come first.
+    results = fetch_json(f"{KIND_TAGS_URL}?page=1&page_size={KIND_TAGS_PAGE_SIZE}")
+    container_tags = results["results"]
+    pages = -(-results["count"] // KIND_TAGS_PAGE_SIZE)
+    with ThreadPoolExecutor() as executor:
+        for page in executor.map(
+            fetch_json,
+            [
+                f"{KIND_TAGS_URL}?page={page}&page_size={KIND_TAGS_PAGE_SIZE}"
+                for page in range(2, pages + 1)
+            ],
+        ):
+            container_tags += page["results"]
     return container_tags
 
 
 def get_versions():
-    oss_versions = get_kubernetes_oss_versions()
-    versions = extend_versions(oss_versions, get_azure_aks_versions(), "Azure AKS")
-    versions = extend_versions(versions, get_amazon_eks_versions(), "Amazon EKS")
+    # All of the endpoints are independent so load them concurrently
+    with ThreadPoolExecutor() as executor:
+        oss_versions = executor.submit(get_kubernetes_oss_versions)
+        aks_versions = executor.submit(get_azure_aks_versions)
+        eks_versions = executor.submit(get_amazon_eks_versions)
+        gke_versions = executor.submit(get_google_kubernetes_engine_versions)
+        kind_versions = executor.submit(get_kind_versions)
+
     versions = extend_versions(
-        versions, get_google_kubernetes_engine_versions(), "Google Kubernetes Engine"
+        oss_versions.result(), aks_versions.result(), "Azure AKS"
     )
-    container_tags = get_kind_versions()
+    versions = extend_versions(versions, eks_versions.result(), "Amazon EKS")
+    versions = extend_versions(
+        versions, gke_versions.result(), "Google Kubernetes Engine"
+    )
+    container_tags = kind_versions.result()
+
+    # Index the newest non-alpha tag for each minor version in a single pass
+    # over the tags. Tags are listed newest first so keep the first we see.
+    latest_tags = {}
+    for tag in container_tags:
+        match = KIND_TAG_RE.match(tag["name"])
+        if match and "alpha" not in tag["name"]:
+            latest_tags.setdefault(match.group(1), tag["name"][1:])
 
     for version in versions:
-        try:
-            version["latest_kind_container"] = [
-                x["name"]
-                for x in container_tags
-                if version["cycle"] in x["name"] and "alpha" not in x["name"]
-            ][0][1:]
-        except IndexError:
-            version["latest_kind_container"] = None
+        version["latest_kind_container"] = latest_tags.get(version["cycle"])
 
     before_length = len(versions)
     print("Pruning versions that do not have a kind release yet...")
@@ -155,21 +177,28 @@ def update_workflow(versions, workflow_path):
     workflow_path = Path(workflow_path)
     workflow = yaml.load(workflow_path)
     latest_kind_container = versions[0]["latest_kind_container"]
+    include = [
+        {
+            "python-version": "3.10",
+            "kubernetes-version": version["latest_kind_container"],
+        }
+        for version in versions[1:]
+    ]
+    matrices = [workflow["jobs"]["test"]["strategy"]["matrix"]]
     if "minimal-deps" in workflow["jobs"]:
-        workflow["jobs"]["minimal-deps"]["strategy"]["matrix"]["kubernetes-version"][
-            0
-        ] = latest_kind_container
-    workflow["jobs"]["test"]["strategy"]["matrix"]["kubernetes-version"][
-        0
-    ] = latest_kind_container
-    workflow["jobs"]["test"]["strategy"]["matrix"]["include"] = []
-    for version in versions[1:]:
-        workflow["jobs"]["test"]["strategy"]["matrix"]["include"].append(
-            {
-                "python-version": "3.10",
-                "kubernetes-version": version["latest_kind_container"],
-            }
-        )
+        matrices.append(workflow["jobs"]["minimal-deps"]["strategy"]["matrix"])
+
+    # Skip dumping the workflow when nothing has changed
+    if (
+        all(m["kubernetes-version"][0] == latest_kind_container for m in matrices)
+        and matrices[0].get("include") == include
+    ):
+        print(f"{workflow_path} is already up to date")
+        return
+
+    for matrix in matrices:
+        matrix["kubernetes-version"][0] = latest_kind_container
+    matrices[0]["include"] = include
     yaml.dump(workflow, workflow_path)
 
 
@@ -179,10 +208,8 @@ def update_badges(filename, versions):
     v = [x["cycle"] for x in versions]
     v.sort()
     version_list = "%7C".join(v)
-    readme = re.sub(
-        r"img.shields.io/badge/Kubernetes%20support.*-blue",
-        f"img.shields.io/badge/Kubernetes%20support-{version_list}-blue",
-        readme,
+    readme = BADGE_RE.sub(
+        f"img.shields.io/badge/Kubernetes%20support-{version_list}-blue", readme
     )
     Path(filename).write_text(readme)
 
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: BSD 3-Clause License
 import gc
 import os
+import subprocess
 import time
 from collections.abc import Generator
 
@@ -11,10 +12,17 @@ from pytest_kind.cluster import KindCluster
 
 @pytest.fixture
 def ensure_gc():
-    """Ensure garbage collection is run before and after the test."""
-    gc.collect()
-    yield
+    """Ensure garbage collection is run before and after the test.
+
+    Automatic collection is disabled during the test so that it only happens at these points.
+    """
     gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+        gc.collect()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -30,12 +38,33 @@ def k8s_cluster(request) -> Generator[KindCluster, None, None]:
     kind_cluster.create()
     os.environ["KUBECONFIG"] = str(kind_cluster.kubeconfig_path)
     # CI fix, wait for default service account to be created before continuing
+    # Watch for it so we can continue as soon as it exists, and only retry if
+    # kubectl exits without seeing it (e.g. the API server isn't up yet)
+    kind_cluster.ensure_kubectl()
     while True:
-        try:
-            kind_cluster.kubectl("get", "serviceaccount", "default")
+        with subprocess.Popen(
+            [
+                str(kind_cluster.kubectl_path),
+                "get",
+                "serviceaccounts",
+                "--namespace=default",
+                "--field-selector=metadata.name=default",
+                "--watch",
+                "--output=name",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+        ) as watch:
+            assert watch.stdout is not None
+            created = watch.stdout.readline()
+            watch.terminate()
+        if created:
             break
-        except Exception:
-            time.sleep(1)
+        time.sleep(1)
+    # Move everything alive so far into the permanent generation so collections
+    # during the session don't need to traverse these long lived objects
+    gc.freeze()
     yield kind_cluster
     del os.environ["KUBECONFIG"]
     if not request.config.getoption("keep_cluster"):  # pragma: no cover
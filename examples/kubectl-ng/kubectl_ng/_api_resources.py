@@ -1,5 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
+from operator import itemgetter
+
 import typer
 from rich import box
 from rich.console import Console
@@ -69,8 +71,8 @@ async def api_resources(
 
     """
     kubernetes = await kr8s.asyncio.api()
-    categories = [c.strip() for c in categories.split(",")] if categories else None
-    verbs = [v.strip() for v in verbs.split(",")] if verbs else None
+    categories = {c.strip() for c in categories.split(",")} if categories else None
+    verbs = {v.strip() for v in verbs.split(",")} if verbs else None
 
     resources = await kubernetes.api_resources()
 
@@ -85,47 +87,42 @@ async def api_resources(
         table.add_column("Categories", no_wrap=True)
 
     if output == "name":
+        names = []
         for resource in resources:
-            if resource["version"] != "v1":
-                console.print(f"{resource['name']}.{resource['version'].split('/')[0]}")
+            version = resource["version"]
+            if version != "v1":
+                names.append(f"{resource['name']}.{version.partition('/')[0]}")
             else:
-                console.print(resource["name"])
+                names.append(resource["name"])
+        console.print("\n".join(names))
         return
 
     if sort_by == "name":
-        resources = sorted(resources, key=lambda r: r["name"])
+        resources = sorted(resources, key=itemgetter("name"))
     elif sort_by == "kind":
-        resources = sorted(resources, key=lambda r: r["kind"])
+        resources = sorted(resources, key=itemgetter("kind"))
 
     for resource in resources:
+        version = resource["version"]
+        resource_namespaced = resource["namespaced"]
+        resource_categories = resource.get("categories", ())
+        resource_verbs = resource.get("verbs", ())
         if (
-            (not api_group or resource["version"].startswith(api_group))
-            and (
-                categories is None
-                or set(categories).issubset(set(resource.get("categories", [])))
-            )
-            and (
-                namespaced is None or str(resource["namespaced"]).lower() == namespaced
-            )
-            and (verbs is None or set(verbs).issubset(set(resource.get("verbs", []))))
+            (not api_group or version.startswith(api_group))
+            and (categories is None or categories.issubset(resource_categories))
+            and (namespaced is None or str(resource_namespaced).lower() == namespaced)
+            and (verbs is None or verbs.issubset(resource_verbs))
         ):
-            if output == "name":
-                if resource["version"] != "v1":
-                    console.print(
-                        f"{resource['name']}.{resource['version'].split('/')[0]}"
-                    )
-                else:
-                    console.print(resource["name"])
             data = [
                 resource["name"],
-                "[magenta]" + ",".join(resource.get("shortNames", [])),
-                resource["version"],
-                "[green]true" if resource["namespaced"] else "[indian_red1]false",
+                f"[magenta]{','.join(resource.get('shortNames', ()))}",
+                version,
+                "[green]true" if resource_namespaced else "[indian_red1]false",
                 resource["kind"],
             ]
             if output == "wide":
-                data.append(",".join(resource["verbs"]))
-                data.append(",".join(resource.get("categories", [])))
+                data.append(",".join(resource_verbs))
+                data.append(",".join(resource_categories))
             table.add_row(*data)
 
     if output != "name":
@@ -15,6 +15,6 @@ async def api_versions():
         kubectl-ng api-versions
 
     """
-    api = kr8s.api()
-    for version in sorted(api.api_versions()):
-        console.print(version)
+    api = await kr8s.asyncio.api()
+    versions = [version async for version in api.api_versions()]
+    console.print("\n".join(sorted(versions)))
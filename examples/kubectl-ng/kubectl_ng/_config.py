@@ -4,6 +4,7 @@ from typing import Annotated, Optional
 
 import rich.table
 import typer
+import yaml
 from rich import box
 from rich.console import Console
 
@@ -33,7 +34,7 @@ def config_get_clusters():
     """Display clusters defined in the kubeconfig."""
     try:
         clusters = [cluster["name"] for cluster in kr8s.api().auth.kubeconfig.clusters]
-    except:  # noqa
+    except (AttributeError, KeyError, OSError, ValueError, yaml.YAMLError):
         clusters = []
 
     table = rich.table.Table(box=box.SIMPLE)
@@ -48,7 +49,7 @@ def config_get_users():
     """Display users defined in the kubeconfig."""
     try:
         users = [user["name"] for user in kr8s.api().auth.kubeconfig.users]
-    except:  # noqa
+    except (AttributeError, KeyError, OSError, ValueError, yaml.YAMLError):
         users = []
 
     table = rich.table.Table(box=box.SIMPLE)
@@ -64,7 +65,7 @@ def config_get_contexts(name: Annotated[Optional[str], typer.Argument()] = None)
     try:
         kubeconfig = kr8s.api().auth.kubeconfig
         contexts = kubeconfig.contexts
-    except:  # noqa
+    except (AttributeError, KeyError, OSError, ValueError, yaml.YAMLError):
         contexts = []
 
     table = rich.table.Table(box=box.SIMPLE)
@@ -73,11 +74,12 @@ def config_get_contexts(name: Annotated[Optional[str], typer.Argument()] = None)
     table.add_column("Cluster", style="blue", no_wrap=True)
     table.add_column("Auth Info", style="orange3", no_wrap=True)
     table.add_column("Namespace", style="yellow", no_wrap=True)
+    if name:
+        contexts = [context for context in contexts if context["name"] == name]
+    current_context = kubeconfig.current_context if contexts else None
     for context in contexts:
-        if name and context["name"] != name:
-            continue
         table.add_row(
-            "*" if context["name"] == kubeconfig.current_context else "",
+            "*" if context["name"] == current_context else "",
             context["name"],
             context["context"]["cluster"],
             context["context"]["user"],
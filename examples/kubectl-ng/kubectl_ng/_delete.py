@@ -43,20 +43,30 @@ async def delete(
         help="If true, wait for resources to be gone before returning. This waits for finalizers.",
     ),
 ):
-    api = await kr8s.asyncio.api()
+    api = await kr8s.asyncio.api(disk_cache=True)
     try:
         objs = await objects_from_files(filename, api)
     except Exception as e:
         console.print(f"[red]Error loading objects from {filename}[/red]: {e}")
         raise typer.Exit(1)
-    for obj in objs:
+
+    failed = False
+
+    async def delete_object(obj):
+        nonlocal failed
         try:
             await obj.delete()
         except Exception as e:
             console.print(f"[red]Error deleting {obj}[/red]: {e}")
-            raise typer.Exit(1)
+            failed = True
+            return
         console.print(f'[green]{obj.singular} "{obj}" deleted [/green]')
+        if wait:
+            await obj.wait("delete")
+
+    # Deletions are independent of each other so send them all concurrently
     async with anyio.create_task_group() as tg:
         for obj in objs:
-            if wait:
-                tg.start_soon(obj.wait, "delete")
+            tg.start_soon(delete_object, obj)
+    if failed:
+        raise typer.Exit(1)
@@ -1,13 +1,32 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
+import os
 import sys
 
 import typer
-from rich.console import Console
 
-from kr8s.asyncio.objects import Pod
 
-console = Console()
+class FdWriter:
+    """Write straight to a file descriptor without any Python level buffering."""
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def write(self, data):
+        # os.write may write less than we give it, so keep going until it is all out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.fd, view) :]
+
+
+def unbuffered(stream):
+    # Anything already written to the stream must come out before our output
+    stream.flush()
+    try:
+        return FdWriter(stream.fileno())
+    except (AttributeError, OSError):
+        # Not backed by a real file, e.g. when output is being captured
+        return stream.buffer
 
 
 async def kexec(
@@ -29,11 +48,15 @@ async def kexec(
     command: list[str] = typer.Argument(..., help="COMMAND [args...]"),
 ):
     """Execute a command in a container."""
+    from kr8s.asyncio.objects import Pod
+
     pod = await Pod.get(resource, namespace=namespace)
     await pod.exec(
         command,
         container=container,
-        stdout=sys.stdout.buffer,
-        stderr=sys.stderr.buffer,
+        # Write each frame to the terminal as it arrives rather than holding it in
+        # the sys.stdout buffer until it fills up or the process exits
+        stdout=unbuffered(sys.stdout),
+        stderr=unbuffered(sys.stderr),
         check=False,
     )
@@ -2,21 +2,19 @@
 # SPDX-License-Identifier: BSD 3-Clause License
 from datetime import timedelta
 
+_UNITS = ((86400, "d"), (3600, "h"), (60, "m"), (1, "s"))
+
 
 def time_delta_to_string(td: timedelta, accuracy: int = 1, suffix: str = "") -> str:
-    parts = []
-    if td >= timedelta(seconds=5):
-        parts.append(f"{td.seconds%60}s")
-    if td >= timedelta(minutes=1):
-        parts.append(f"{(td.seconds//60)%60}m")
-    if td >= timedelta(hours=1):
-        parts.append(f"{(td.seconds//3600)%24}h")
-    if td >= timedelta(days=1):
-        parts.append(f"{td.days}d")
-    if not parts:
+    seconds = int(td.total_seconds())
+    if seconds < 5:
         return "Just Now"
-    parts.reverse()
-    return (
-        "".join([part for part in parts[:accuracy] if not part.startswith("0")])
-        + suffix
-    )
+    # Start from the largest unit that is non-zero and show up to `accuracy` units
+    # from there, skipping any that are zero
+    start = next(i for i, (size, _) in enumerate(_UNITS) if seconds >= size)
+    parts = []
+    for size, symbol in _UNITS[start : start + accuracy]:
+        value, seconds = divmod(seconds, size)
+        if value:
+            parts.append(f"{value}{symbol}")
+    return "".join(parts) + suffix
@@ -17,25 +17,43 @@ TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 console = Console()
 
 
-async def draw_table(kind, response, resource_names):
+async def draw_table(
+    kind, response, resource_names, show_labels=False, label_columns=()
+):
     table = rich.table.Table(box=box.SIMPLE)
     table.add_column("Namespace", style="magenta", no_wrap=True)
 
-    for column in response.column_definitions:
-        if column["priority"] == 0:
-            kwargs = {}
-            if column["name"] == "Name":
-                kwargs = {"style": "cyan", "no_wrap": True}
-            table.add_column(column["name"], **kwargs)
+    # Work out which columns to show once rather than for every row
+    columns = [
+        i
+        for i, column in enumerate(response.column_definitions)
+        if column["priority"] == 0
+    ]
+    for i in columns:
+        name = response.column_definitions[i]["name"]
+        kwargs = {}
+        if name == "Name":
+            kwargs = {"style": "cyan", "no_wrap": True}
+        table.add_column(name, **kwargs)
+    for label in label_columns:
+        table.add_column(label)
+    if show_labels:
+        table.add_column("Labels")
 
     for row in response.rows:
-        if not resource_names or row["object"]["metadata"]["name"] == resource_names[0]:
-            r = [
-                str(row)
-                for row, column in zip(row["cells"], response.column_definitions)
-                if column["priority"] == 0
-            ]
-            table.add_row(row["object"]["metadata"]["namespace"], *r)
+        cells = row["cells"]
+        metadata = row["object"]["metadata"]
+        labels = metadata.get("labels") or {}
+        table.add_row(
+            metadata["namespace"],
+            *(str(cells[i]) for i in columns),
+            *(labels.get(label, "") for label in label_columns),
+            *(
+                (",".join(f"{key}={value}" for key, value in labels.items()),)
+                if show_labels
+                else ()
+            ),
+        )
 
     if not table.rows:
         if resource_names:
@@ -46,17 +64,45 @@ async def draw_table(kind, response, resource_names):
     return table
 
 
-async def get_resources(resources, label_selector, field_selector):
+async def get_resources(
+    resources,
+    label_selector,
+    field_selector,
+    resource_names=(),
+    params=None,
+    namespace=None,
+    api=None,
+):
+    # Fetch all kinds concurrently, holding on to any errors so that we can raise
+    # the first one in the order the kinds were requested
+    results = {}
+
+    async def get_resource(kind):
+        try:
+            results[kind] = await anext(
+                kr8s.asyncio.get(
+                    kind,
+                    *resource_names,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    as_object=Table,
+                    params=params,
+                    api=api,
+                )
+            )
+        except Exception as e:
+            results[kind] = e
+
+    async with anyio.create_task_group() as tg:
+        for kind in resources:
+            tg.start_soon(get_resource, kind)
+
     data = {}
     for kind in resources:
-        data[kind] = await anext(
-            kr8s.asyncio.get(
-                kind,
-                label_selector=label_selector,
-                field_selector=field_selector,
-                as_object=Table,
-            )
-        )
+        if isinstance(results[kind], Exception):
+            raise results[kind]
+        data[kind] = results[kind]
     return data
 
 
@@ -139,29 +185,103 @@ async def get(
         raise typer.BadParameter(
             f"Format '{' '.join(resources)}' not currently supported."
         )
-    kubernetes = await kr8s.asyncio.api()
-    if namespace:
-        kubernetes.namespace = namespace
+    # Support both -L key1,key2 and -L key1 -L key2
+    label_columns = [
+        label for labels in label_columns for label in labels.split(",") if label
+    ]
+    kubernetes = await kr8s.asyncio.api(disk_cache=True)
+    # Pass the namespace with each call rather than setting it on the client, which
+    # is shared with any later commands run in the same process
     if all_namespaces:
-        kubernetes.namespace = kr8s.ALL
+        namespace = kr8s.ALL
 
-    data = await get_resources(resources, label_selector, field_selector)
+    # Names are filtered on the server with a field selector
+    data = await get_resources(
+        resources,
+        label_selector,
+        field_selector,
+        resource_names,
+        namespace=namespace,
+        api=kubernetes,
+    )
 
     if not watch:
         for kind, response in data.items():
-            table = await draw_table(kind, response, resource_names)
+            table = await draw_table(
+                kind, response, resource_names, show_labels, label_columns
+            )
             if table:
                 console.print(table)
     else:
         kind = list(data)[0]
         response = data[kind]
-        table = await draw_table(kind, response, resource_names)
-        with Live(table, console=console, auto_refresh=False) as live:
+        table = await draw_table(
+            kind, response, resource_names, show_labels, label_columns
+        )
+        rows = [
+            (
+                row["object"]["metadata"]["namespace"],
+                row["cells"],
+                row["object"]["metadata"].get("labels"),
+            )
+            for row in response.rows
+        ]
+        changed = anyio.Event()
+        watch_field_selector = field_selector
+        if resource_names:
+            watch_field_selector = ",".join(
+                filter(None, [f"metadata.name={resource_names[0]}", field_selector])
+            )
+
+        async def watch_for_changes(kind):
+            # The server closes watches periodically so start a new one when it does
             while True:
-                await anyio.sleep(5)
-                data = await get_resources(resources, label_selector, field_selector)
-                # TODO handle changes in resources
-                for kind, response in data.items():
-                    table = await draw_table(kind, response, resource_names)
-                live.update(table)
-                live.refresh()
+                async for _ in kr8s.asyncio.watch(
+                    kind,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    field_selector=watch_field_selector,
+                    api=kubernetes,
+                ):
+                    changed.set()
+
+        with Live(table, console=console, auto_refresh=False) as live:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(watch_for_changes, kind)
+                # Only redraw when the server reports a change. Events that arrive
+                # while we are redrawing are coalesced into a single redraw.
+                while True:
+                    await changed.wait()
+                    changed = anyio.Event()
+                    # We only get here after the watch cache has seen a change, so
+                    # list from the cache rather than going through to etcd
+                    data = await get_resources(
+                        resources,
+                        label_selector,
+                        field_selector,
+                        resource_names,
+                        params={"resourceVersion": "0"},
+                        namespace=namespace,
+                        api=kubernetes,
+                    )
+                    # TODO handle changes in resources
+                    for kind, response in data.items():
+                        # Many events (e.g. annotation or resourceVersion bumps) do
+                        # not change anything we display, so skip rebuilding the
+                        # table and having Rich measure every cell again
+                        new_rows = [
+                            (
+                                row["object"]["metadata"]["namespace"],
+                                row["cells"],
+                                row["object"]["metadata"].get("labels"),
+                            )
+                            for row in response.rows
+                        ]
+                        if new_rows == rows:
+                            continue
+                        rows = new_rows
+                        table = await draw_table(
+                            kind, response, resource_names, show_labels, label_columns
+                        )
+                        live.update(table)
+                        live.refresh()
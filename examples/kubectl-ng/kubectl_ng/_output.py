@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, Kr8s Developers (See LICENSE for list)
+# SPDX-License-Identifier: BSD 3-Clause License
+import sys
+
+from rich.console import Console
+from rich.text import Text
+
+# Messages are plain strings, so don't run Rich's highlighter regexes over them
+console = Console(highlight=False)
+
+
+def echo(message):
+    # Styling is only useful on a terminal. When the output is being piped
+    # somewhere skip Rich's rendering (and its line wrapping) and write plain text.
+    if console.is_terminal:
+        console.print(message)
+    else:
+        sys.stdout.write(Text.from_markup(message).plain + "\n")
@@ -2,16 +2,44 @@
 # SPDX-License-Identifier: BSD 3-Clause License
 
 import asyncio
+import atexit
+import sys
 from contextlib import suppress
 from functools import wraps
 
 import typer
 
 
+def _new_event_loop():
+    loop = asyncio.new_event_loop()
+    # Start tasks running straight away instead of waiting for the next loop
+    # iteration, so requests in fan-outs are sent without an extra scheduler hop
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+_runner = None
+
+
+def _get_runner():
+    # Reuse one event loop for every command run in this process rather than
+    # setting up and tearing down a new loop and executor each time
+    global _runner
+    if _runner is None:
+        if sys.version_info >= (3, 12):
+            _runner = asyncio.Runner(loop_factory=_new_event_loop)
+        else:
+            _runner = asyncio.Runner()
+        atexit.register(_runner.close)
+    return _runner
+
+
 def _typer_async(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
         with suppress(asyncio.CancelledError, KeyboardInterrupt):
+            if sys.version_info >= (3, 11):
+                return _get_runner().run(f(*args, **kwargs))
             return asyncio.run(f(*args, **kwargs))
 
     return wrapper
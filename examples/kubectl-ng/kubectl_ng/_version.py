@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: BSD 3-Clause License
 import json
 import sys
+from functools import lru_cache
 
 import typer
 import yaml
@@ -10,8 +11,45 @@ from rich.syntax import Syntax
 
 import kr8s
 
+from ._output import echo
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# None of this changes while the process is running so only build it once
+CLIENT_VERSION = {
+    "client": "kubectl-ng",
+    "gitVersion": kr8s.__version__,
+    "major": str(kr8s.__version_tuple__[0]),
+    "minor": str(kr8s.__version_tuple__[1]),
+    "pythonVersion": sys.version,
+}
+
+
+def dumps_json(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+@lru_cache
+def dumps_client_version(output):
+    # With --client the output only depends on CLIENT_VERSION so we only need to
+    # serialize it once
+    versions = {"clientVersion": CLIENT_VERSION}
+    if output == "yaml":
+        return yaml.dump(versions, Dumper=YamlDumper)
+    return dumps_json(versions)
+
 
 async def version(
     client: bool = typer.Option(
@@ -32,14 +70,7 @@ async def version(
         # Print the client and server versions for the current context
         kubectl version
     """
-    versions = {}
-    versions["clientVersion"] = {
-        "client": "kubectl-ng",
-        "gitVersion": kr8s.__version__,
-        "major": kr8s.__version__.split(".")[0],
-        "minor": kr8s.__version__.split(".")[1],
-        "pythonVersion": sys.version,
-    }
+    versions = {"clientVersion": CLIENT_VERSION}
     if not client:
         api = await kr8s.asyncio.api()
         versions["serverVersion"] = await api.version()
@@ -47,28 +78,39 @@ async def version(
     if output == "":
         style = "[magenta][bold]"
         client_version = versions["clientVersion"]["gitVersion"]
-        console.print(f"Client Version: {style}v{client_version}")
-        server_version = versions["serverVersion"]["gitVersion"]
-        console.print(f"Server Version: {style}{server_version}")
+        echo(f"Client Version: {style}v{client_version}")
+        if not client:
+            server_version = versions["serverVersion"]["gitVersion"]
+            echo(f"Server Version: {style}{server_version}")
 
     elif output == "yaml":
+        if client:
+            text = dumps_client_version(output)
+        else:
+            text = yaml.dump(versions, Dumper=YamlDumper)
         console.print(
             Syntax(
-                yaml.dump(versions),
+                text,
                 "yaml",
                 background_color="default",
             )
         )
 
     elif output == "json":
-        console.print(
-            Syntax(
-                json.dumps(versions, indent=2),
-                "json",
-                background_color="default",
+        text = dumps_client_version(output) if client else dumps_json(versions)
+        if not console.is_terminal:
+            # Nobody will see the highlighting when piping into another tool, so
+            # skip tokenizing the JSON and write it out as is
+            sys.stdout.write(text + "\n")
+        else:
+            console.print(
+                Syntax(
+                    text,
+                    "json",
+                    background_color="default",
+                )
             )
-        )
 
     else:
-        console.print("error: --output must be 'yaml' or 'json'")
+        echo("error: --output must be 'yaml' or 'json'")
         raise typer.Exit(code=1)
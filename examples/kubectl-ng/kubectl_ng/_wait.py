@@ -1,15 +1,33 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
 import asyncio
+import re
 from typing import Optional
 
+import anyio
 import typer
-from rich.console import Console
 
 import kr8s
 from kr8s.asyncio.objects import APIObject, object_from_name_type
 
-console = Console()
+from ._output import echo
+
+TIMEOUT_RE = re.compile(r"(-?\d+)([smh])")
+TIMEOUT_UNITS = {"s": 1, "m": 60, "h": 60 * 60}
+TIMEOUT_WEEK = 7 * 24 * 60 * 60
+
+
+def parse_timeout(timeout: Optional[str]) -> Optional[int]:
+    """Convert a --timeout duration such as 30s, 5m or 1h to seconds."""
+    if not timeout:
+        return None
+    match = TIMEOUT_RE.fullmatch(timeout)
+    if not match:
+        raise ValueError("--timeout must be a duration such as 30s, 5m or 1h")
+    seconds = int(match.group(1)) * TIMEOUT_UNITS[match.group(2)]
+    # Like kubectl a negative timeout waits for a week rather than giving up at once
+    return seconds if seconds >= 0 else TIMEOUT_WEEK
+
 
 # Missing Options
 # TODO --allow-missing-template-keys
@@ -21,6 +39,34 @@ console = Console()
 # TODO --template
 
 
+async def bounded_gather(coros, limit):
+    # Like asyncio.gather but with at most `limit` of the coroutines running at once,
+    # so waiting on lots of resources doesn't open a connection for every one of them
+    results = [None] * len(coros)
+    errors = []
+    limiter = anyio.CapacityLimiter(limit)
+
+    async def run(i, coro):
+        try:
+            async with limiter:
+                results[i] = await coro
+        except Exception as e:
+            # Cancel everything else on the first error instead of waiting for the
+            # rest of the requests to finish
+            errors.append(e)
+            tg.cancel_scope.cancel()
+        finally:
+            # Avoid "never awaited" warnings for coroutines cancelled before starting
+            coro.close()
+
+    async with anyio.create_task_group() as tg:
+        for i, coro in enumerate(coros):
+            tg.start_soon(run, i, coro)
+    if errors:
+        raise errors[0]
+    return results
+
+
 async def wait(
     resources: list[str] = typer.Argument(..., help="TYPE[.VERSION][.GROUP]"),
     all_namespaces: bool = typer.Option(
@@ -75,6 +121,12 @@ async def wait(
         help="The length of time to wait before giving up.  Zero means check once and don't "
         "wait, negative means wait for a week.",
     ),
+    parallelism: int = typer.Option(
+        16,
+        "--parallelism",
+        min=1,
+        help="The maximum number of resources to look up or wait on at once.",
+    ),
 ):
     """Wait for a specific condition on one or many resources.
 
@@ -113,21 +165,26 @@ async def wait(
     api = await kr8s.asyncio.api()
     if all_namespaces:
         namespace = kr8s.ALL
-    if timeout and "s" not in timeout:
-        # TODO support more units
-        console.print("error: --timeout must be a duration in seconds")
+    try:
+        timeout = parse_timeout(timeout)
+    except ValueError as e:
+        echo(f"error: {e}")
         raise typer.Exit(code=1)
-    timeout = int(timeout[:-1]) if timeout else None
     if filename:
-        console.print("error: --filename is not supported yet")
+        echo("error: --filename is not supported yet")
+        raise typer.Exit(code=1)
+    if not conditions:
+        # There is nothing to wait for so bail out before looking anything up
+        echo("error: --for must be specified")
         raise typer.Exit(code=1)
     if not all:
         try:
-            objects = await asyncio.gather(
-                *[object_from_name_type(r, namespace=namespace) for r in resources]
+            objects = await bounded_gather(
+                [object_from_name_type(r, namespace=namespace) for r in resources],
+                parallelism,
             )
         except kr8s.NotFoundError as e:
-            console.print("Error from server (NotFound): " + str(e))
+            echo("Error from server (NotFound): " + str(e))
             raise typer.Exit(code=1)
     else:
         assert len(resources) == 1
@@ -142,10 +199,10 @@ async def wait(
         try:
             await o.wait(conditions=conditions, timeout=timeout)
         except asyncio.TimeoutError:
-            console.print(
-                f"error: timed out waiting for the condition on {o.singular}/{o.name}"
-            )
+            echo(f"error: timed out waiting for the condition on {o.singular}/{o.name}")
             raise typer.Exit(code=1)
-        console.print(f"{o.singular}/{o.name} condition met")
+        echo(f"{o.singular}/{o.name} condition met")
 
-    await asyncio.gather(*[wait_for(o, conditions=conditions) for o in objects])
+    await bounded_gather(
+        [wait_for(o, conditions=conditions) for o in objects], parallelism
+    )
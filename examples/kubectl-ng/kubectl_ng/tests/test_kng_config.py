@@ -1,5 +1,6 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
+from kubectl_ng._config import config_rename_context
 from kubectl_ng.cli import app
 from typer.testing import CliRunner
 
@@ -41,6 +42,18 @@ def test_get_contexts(k8s_cluster):
     assert "foo not found" in result.stdout
 
 
+def test_get_malformed_kubeconfig(tmp_path, monkeypatch):
+    kubeconfig = tmp_path / "config"
+    kubeconfig.write_text("apiVersion: v1\nclusters: [\n")
+    monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+    # Make sure the commands create a client from the broken kubeconfig
+    monkeypatch.setattr(kr8s.asyncio.Api, "_instances", {})
+    for command in ["get-clusters", "get-users", "get-contexts"]:
+        result = runner.invoke(app, ["config", command])
+        assert result.exit_code == 0
+        assert "Name" in result.stdout
+
+
 def test_use_context():
     current_context = kr8s.api().auth.kubeconfig.current_context
     result = runner.invoke(app, ["config", "use-context", current_context])
@@ -48,31 +61,39 @@ def test_use_context():
     assert current_context in result.stdout
 
 
-def test_rename_context():
-    # Get current context
-    current_context = kr8s.api().auth.kubeconfig.current_context
-    result = runner.invoke(app, ["config", "current-context"])
-    assert result.exit_code == 0
-    assert current_context in result.stdout
+async def test_rename_context(capsys):
+    # Call rename-context directly so that both renames share one client rather than
+    # setting up the CLI and reading the kubeconfig again each time
+    api = await kr8s.asyncio.api()
+    current_context = api.auth.kubeconfig.current_context
 
     # Rename current context to foo
-    result = runner.invoke(app, ["config", "rename-context", current_context, "foo"])
-    assert result.exit_code == 0
-    assert current_context in result.stdout
-    assert "foo" in result.stdout
+    await config_rename_context(current_context, "foo")
+    assert f'Context "{current_context}" renamed to "foo".' in capsys.readouterr().out
+    assert api.auth.kubeconfig.current_context == "foo"
 
-    # Check the context rename was successful
+    # Check a fresh CLI invocation reads the renamed context from the kubeconfig
     result = runner.invoke(app, ["config", "current-context"])
     assert result.exit_code == 0
     assert "foo" in result.stdout
 
     # Rename foo back to the original name
-    result = runner.invoke(app, ["config", "rename-context", "foo", current_context])
+    await config_rename_context("foo", current_context)
+    assert f'Context "foo" renamed to "{current_context}".' in capsys.readouterr().out
+    assert api.auth.kubeconfig.current_context == current_context
+
+    result = runner.invoke(app, ["config", "current-context"])
     assert result.exit_code == 0
     assert current_context in result.stdout
-    assert "foo" in result.stdout
 
-    # Check the context revert was successful
+
+def test_rename_context_cli():
+    current_context = kr8s.api().auth.kubeconfig.current_context
+    result = runner.invoke(app, ["config", "rename-context", "foo", "bar"])
+    assert result.exit_code == 1
+    assert "context foo not found" in result.stdout
+
+    # Check the failed rename left the current context alone
     result = runner.invoke(app, ["config", "current-context"])
     assert result.exit_code == 0
     assert current_context in result.stdout
@@ -9,3 +9,19 @@ runner = CliRunner()
 def test_get_pods():
     result = runner.invoke(app, ["get", "pods", "-A"])
     assert result.exit_code == 0
+
+
+def test_get_pods_namespace_does_not_leak():
+    # Commands share a client within a process so check that -n and -A only apply
+    # to the command they were given to
+    env = {"COLUMNS": "200"}
+    result = runner.invoke(app, ["get", "pods", "-n", "kube-system"], env=env)
+    assert result.exit_code == 0
+    assert "kube-system" in result.stdout
+
+    for args in (["-n", "kube-system"], ["-A"]):
+        result = runner.invoke(app, ["get", "pods", *args], env=env)
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["get", "pods"], env=env)
+        assert result.exit_code == 0
+        assert "kube-system" not in result.stdout
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, Kr8s Developers (See LICENSE for list)
+# SPDX-License-Identifier: BSD 3-Clause License
+import pytest
+from kubectl_ng._wait import TIMEOUT_WEEK, parse_timeout
+from kubectl_ng.cli import app
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize(
+    "timeout,seconds",
+    [
+        (None, None),
+        ("0s", 0),
+        ("30s", 30),
+        ("5m", 300),
+        ("1h", 3600),
+        ("-1s", TIMEOUT_WEEK),
+        ("-5m", TIMEOUT_WEEK),
+    ],
+)
+def test_parse_timeout(timeout, seconds):
+    assert parse_timeout(timeout) == seconds
+
+
+@pytest.mark.parametrize("timeout", ["30", "1d", "1.5s", "s"])
+def test_parse_timeout_invalid(timeout):
+    with pytest.raises(ValueError):
+        parse_timeout(timeout)
+
+
+def test_wait_invalid_timeout():
+    result = runner.invoke(app, ["wait", "--for=delete", "pod/foo", "--timeout=1d"])
+    assert result.exit_code == 1
+    assert "--timeout must be a duration" in result.stdout
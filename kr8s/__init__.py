@@ -10,10 +10,12 @@ Both APIs are functionally identical with the same objects, method signatures an
 # ruff: noqa: D102
 from __future__ import annotations
 
+import importlib
 from collections.abc import Generator
 from functools import partial, update_wrapper
+from typing import TYPE_CHECKING
 
-from . import asyncio, objects, portforward
+from . import asyncio
 from ._api import ALL
 from ._api import Api as _AsyncApi
 from ._async_utils import run_sync as _run_sync
@@ -24,7 +26,6 @@ from ._exceptions import (
     NotFoundError,
     ServerError,
 )
-from ._objects import APIObject
 from .asyncio import (
     api as _api,
 )
@@ -44,6 +45,10 @@ from .asyncio import (
     whoami as _whoami,
 )
 
+if TYPE_CHECKING:
+    from . import objects
+    from ._objects import APIObject
+
 try:
     from ._version import version as __version__  # noqa
     from ._version import version_tuple as __version_tuple__  # noqa
@@ -52,6 +57,12 @@ except ImportError:
     __version_tuple__ = (0, 0, 0)
 
 
+# Wrap the async helpers once here rather than on every call
+_get_sync = _run_sync(_get)
+_api_sync = _run_sync(_api)
+_whoami_sync = _run_sync(_whoami)
+
+
 class Api(_AsyncApi):
     _asyncio = False
 
@@ -78,7 +89,9 @@ class Api(_AsyncApi):
         allow_unknown_type: bool = True,
         **kwargs,
     ) -> Generator[objects.APIObject]:
-        yield from _run_sync(self.async_get)(
+        # Iterate a page at a time so we only call into the sync runner thread
+        # once per page of results rather than once per object
+        for page in _run_sync(self._async_get_pages)(
             kind,
             *names,
             namespace=namespace,
@@ -87,7 +100,8 @@ class Api(_AsyncApi):
             as_object=as_object,
             allow_unknown_type=allow_unknown_type,
             **kwargs,
-        )
+        ):
+            yield from page
 
     def watch(  # type: ignore
         self,
@@ -153,7 +167,7 @@ def get(
         >>> ings = kr8s.get("ingress.v1.networking.k8s.io")  # Full with explicit version
         >>> ings = kr8s.get("ingress.networking.k8s.io/v1")  # Full with explicit version alt.
     """
-    return _run_sync(_get)(
+    return _get_sync(
         kind,
         *names,
         namespace=namespace,
@@ -173,6 +187,7 @@ def api(
     serviceaccount: str | None = None,
     namespace: str | None = None,
     context: str | None = None,
+    disk_cache: bool | None = None,
 ) -> Api:
     """Create a :class:`kr8s.Api` object for interacting with the Kubernetes API.
 
@@ -184,6 +199,8 @@ def api(
         serviceaccount: The path of a service account to use
         namespace: The namespace to use
         context: The context to use
+        disk_cache: Whether to cache API discovery data on disk between processes.
+            Defaults to False.
 
     Returns:
         The API object
@@ -193,12 +210,13 @@ def api(
         >>> api = kr8s.api()  # Uses the default kubeconfig
         >>> print(api.version())  # Get the Kubernetes version
     """
-    ret = _run_sync(_api)(
+    ret = _api_sync(
         url=url,
         kubeconfig=kubeconfig,
         serviceaccount=serviceaccount,
         namespace=namespace,
         context=context,
+        disk_cache=disk_cache,
         _asyncio=False,
     )
     assert isinstance(ret, Api)
@@ -215,7 +233,7 @@ def whoami():
         >>> import kr8s
         >>> print(kr8s.whoami())
     """
-    return _run_sync(_whoami)(_asyncio=False)
+    return _whoami_sync(_asyncio=False)
 
 
 version = _run_sync(partial(_k8s_version, _asyncio=False))
@@ -225,6 +243,17 @@ update_wrapper(watch, _watch)
 api_resources = _run_sync(partial(_api_resources, _asyncio=False))
 update_wrapper(api_resources, _api_resources)
 
+
+def __getattr__(name):
+    # The objects and port forwarding modules are a large part of the cost of
+    # importing kr8s and many users never touch them, so import them on first use
+    if name in ("objects", "portforward"):
+        return importlib.import_module(f"{__name__}.{name}")
+    if name == "APIObject":
+        return importlib.import_module(f"{__name__}._objects").APIObject
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "__version__",
     "__version_tuple__",
@@ -5,31 +5,51 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import copy
+import hashlib
 import json
 import logging
+import os
 import ssl
 import threading
+import time
 import warnings
 import weakref
 from collections.abc import AsyncGenerator
 from typing import (
     TYPE_CHECKING,
+    Any,
 )
 
+import anyio
 import httpx
 import httpx_ws
 from asyncache import cached  # type: ignore
 from cachetools import TTLCache  # type: ignore
+from cachetools.keys import hashkey  # type: ignore
 from cryptography import x509
 
 from ._auth import KubeAuth
 from ._data_utils import dict_to_selector, sort_versions
 from ._exceptions import APITimeoutError, ServerError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if TYPE_CHECKING:
     from ._objects import APIObject
 
 ALL = "all"
+# Use the same TTL as kubectl's discovery cache
+DISCOVERY_CACHE_TTL = 10 * 60
+# HTTP clients shared by Api objects that talk to the same server with the same
+# credentials. Connections can't move between event loops so there is a pool per loop.
+_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+# In memory cache of async_api_resources results
+_api_resources_cache: TTLCache = TTLCache(1, 60 * 60 * 6)
 logger = logging.getLogger(__name__)
 
 
@@ -58,7 +78,9 @@ class Api:
         self._kubeconfig = kwargs.get("kubeconfig")
         self._serviceaccount = kwargs.get("serviceaccount")
         self._session: httpx.AsyncClient | None = None
+        self._session_lock = anyio.Lock()
         self._timeout = None
+        self._disk_cache = kwargs.get("disk_cache") or False
         self.auth = KubeAuth(
             url=self._url,
             kubeconfig=self._kubeconfig,
@@ -90,24 +112,80 @@ class Api:
 
     @timeout.setter
     def timeout(self, value):
+        # The session may be shared with other Api objects so the timeout is passed
+        # with each request rather than set on the session
         self._timeout = value
-        if self._session:
-            self._session.timeout = value
 
-    async def _create_session(self) -> None:
-        headers = {"User-Agent": self.__version__, "content-type": "application/json"}
-        if self.auth.token:
-            headers["Authorization"] = f"Bearer {self.auth.token}"
-        if self._session:
-            with contextlib.suppress(RuntimeError):
-                await self._session.aclose()
-            self._session = None
-        self._session = httpx.AsyncClient(
-            base_url=self.auth.server,
-            headers=headers,
-            verify=await self.auth.ssl_context(),
-            timeout=self._timeout,
-            follow_redirects=True,
+    async def _create_session(self, replace: bool = False) -> None:
+        # Concurrent first requests must share one session rather than each creating
+        # their own, so only the auth and TLS retries get to replace an open session
+        async with self._session_lock:
+            if self._session and not self._session.is_closed and not replace:
+                return
+            headers = {
+                "User-Agent": self.__version__,
+                "content-type": "application/json",
+            }
+            if self.auth.token:
+                headers["Authorization"] = f"Bearer {self.auth.token}"
+            try:
+                sessions = _sessions.setdefault(asyncio.get_running_loop(), {})
+            except RuntimeError:
+                sessions = {}
+            key = await self._session_key(headers)
+            if replace and self._session and not self._session.is_closed:
+                # We only replace an open session after auth or TLS errors, so make sure
+                # it doesn't get handed out of the pool again
+                for k, session in list(sessions.items()):
+                    if session is self._session:
+                        del sessions[k]
+                await self._detach_session()
+            elif key in sessions and not sessions[key].is_closed:
+                # Reuse the open connections of another Api for the same cluster
+                self._session = sessions[key]
+                return
+            self._session = httpx.AsyncClient(
+                base_url=self.auth.server,
+                headers=headers,
+                verify=await self.auth.ssl_context(),
+                # Requests always pass the timeout of the Api making them
+                timeout=None,
+                follow_redirects=True,
+            )
+            sessions[key] = self._session
+
+    async def _detach_session(self) -> None:
+        session, self._session = self._session, None
+        if not session:
+            return
+        # Other Api objects may still have requests or watches open on this session,
+        # so leave it to the last one using it to close it
+        for instances in Api._instances.values():
+            for api in list(instances.values()):
+                if api._session is session:
+                    return
+        with contextlib.suppress(RuntimeError):
+            await session.aclose()
+
+    async def _session_key(self, headers: dict) -> tuple:
+        # Certificate data from a kubeconfig is written to new temporary files for
+        # every Api so compare the contents of the files rather than their paths
+        files = []
+        for path in (
+            self.auth.client_cert_file,
+            self.auth.client_key_file,
+            self.auth.server_ca_file,
+        ):
+            if path:
+                data = await anyio.Path(path).read_bytes()
+                files.append(hashlib.sha256(data).hexdigest())
+            else:
+                files.append(None)
+        return (
+            self.auth.server,
+            self.auth._insecure_skip_tls_verify,
+            tuple(sorted(headers.items())),
+            *files,
         )
 
     def _construct_url(
@@ -149,6 +227,8 @@ class Api:
             await self._create_session()
         url = self._construct_url(version, base, namespace, url)
         kwargs.update(url=url, method=method)
+        # The session may be shared with other Api objects that have their own timeout
+        kwargs.setdefault("timeout", self._timeout)
         if self.auth.tls_server_name:
             kwargs["extensions"] = {"sni_hostname": self.auth.tls_server_name}
         auth_attempts = 0
@@ -176,7 +256,7 @@ class Api:
                     )
                     auth_attempts += 1
                     await self.auth.reauthenticate()
-                    await self._create_session()
+                    await self._create_session(replace=True)
                     continue
                 else:
                     if e.response.status_code >= 400 and e.response.status_code < 500:
@@ -202,7 +282,7 @@ class Api:
                 if ssl_attempts < 3:
                     ssl_attempts += 1
                     await self.auth.reauthenticate()
-                    await self._create_session()
+                    await self._create_session(replace=True)
                     continue
                 else:
                     raise
@@ -226,6 +306,7 @@ class Api:
             await self._create_session()
         url = self._construct_url(version, base, namespace, url)
         kwargs.update(url=url)
+        kwargs.setdefault("timeout", self._timeout)
         if self.auth.tls_server_name:
             kwargs["extensions"] = {"sni_hostname": self.auth.tls_server_name}
         auth_attempts = 0
@@ -286,7 +367,7 @@ class Api:
                 "POST",
                 version="authentication.k8s.io/v1",
                 url="tokenreviews",
-                data=json.dumps(payload),
+                data=dumps_json(payload),
             ) as r:
                 data = r.json()
                 return data["status"]["user"]["username"]
@@ -316,29 +397,43 @@ class Api:
         """Lookup a Kubernetes resource kind."""
         from ._objects import parse_kind
 
-        resources = await self.async_api_resources()
         kind, group, version = parse_kind(kind)
         if group:
             version = f"{group}/{version}"
-        for resource in resources:
-            if (not version or version in resource["version"]) and (
-                kind == resource["name"]
-                or kind == resource["kind"]
-                or kind == resource["singularName"]
-                or ("shortNames" in resource and kind in resource["shortNames"])
-            ):
-                if "/" in resource["version"]:
+
+        def find(resources: list[dict]) -> tuple[str, str, bool] | None:
+            for resource in resources:
+                if (not version or version in resource["version"]) and (
+                    kind == resource["name"]
+                    or kind == resource["kind"]
+                    or kind == resource["singularName"]
+                    or ("shortNames" in resource and kind in resource["shortNames"])
+                ):
+                    if "/" in resource["version"]:
+                        return (
+                            f"{resource['singularName']}.{resource['version']}",
+                            resource["name"],
+                            resource["namespaced"],
+                        )
                     return (
-                        f"{resource['singularName']}.{resource['version']}",
+                        f"{resource['singularName']}/{resource['version']}",
                         resource["name"],
                         resource["namespaced"],
                     )
-                return (
-                    f"{resource['singularName']}/{resource['version']}",
-                    resource["name"],
-                    resource["namespaced"],
-                )
-        raise ValueError(f"Kind {kind} not found.")
+            return None
+
+        result = find(await self.async_api_resources())
+        if result is None and self._disk_cache:
+            # The disk cache may be older than the resource (e.g. a CRD that was
+            # installed since) so check fresh discovery data before giving up
+            resources = await self._async_discover_api_resources()
+            # Keep the fresh data in memory too so that later lookups don't walk
+            # discovery again
+            _api_resources_cache[hashkey(self)] = resources
+            result = find(resources)
+        if result is None:
+            raise ValueError(f"Kind {kind} not found.")
+        return result
 
     @contextlib.asynccontextmanager
     async def async_get_kind(
@@ -458,9 +553,34 @@ class Api:
         allow_unknown_type: bool = True,
         **kwargs,
     ) -> AsyncGenerator[APIObject]:
+        async for page in self._async_get_pages(
+            kind,
+            *names,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            as_object=as_object,
+            allow_unknown_type=allow_unknown_type,
+            **kwargs,
+        ):
+            for resource in page:
+                yield resource
+
+    async def _async_get_pages(
+        self,
+        kind: str | type,
+        *names: str,
+        namespace: str | None = None,
+        label_selector: str | dict | None = None,
+        field_selector: str | dict | None = None,
+        as_object: type[APIObject] | None = None,
+        allow_unknown_type: bool = True,
+        **kwargs,
+    ) -> AsyncGenerator[list[APIObject]]:
+        """Get Kubernetes resources one page of results at a time."""
         names_list = [None] if not names else names
         for name in names_list:
-            async for resource in self._async_get_single(
+            async for page in self._async_get_single(
                 kind,
                 name,
                 namespace=namespace,
@@ -470,7 +590,7 @@ class Api:
                 allow_unknown_type=allow_unknown_type,
                 **kwargs,
             ):
-                yield resource
+                yield page
 
     async def _async_get_single(
         self,
@@ -482,7 +602,7 @@ class Api:
         as_object: type[APIObject] | None = None,
         allow_unknown_type: bool = True,
         **kwargs,
-    ) -> AsyncGenerator[APIObject]:
+    ) -> AsyncGenerator[list[APIObject]]:
 
         if name is not None:
             # Normalized field_selector to a string
@@ -496,7 +616,7 @@ class Api:
             field_selector = f"metadata.name={name},{field_selector_str}"
 
         headers = {}
-        params = {}
+        params = dict(kwargs.pop("params", None) or {})
         continue_paging = True
         if as_object:
             group, version = as_object.version.split("/")
@@ -516,25 +636,27 @@ class Api:
                 params=params,
                 **kwargs,
             ) as (obj_cls, response):
-                resourcelist = response.json()
+                resourcelist = loads_json(response.content)
                 if (
                     as_object
                     and "kind" in resourcelist
                     and resourcelist["kind"] == as_object.kind
                 ):
-                    yield as_object(resourcelist, api=self)
+                    yield [as_object(resourcelist, api=self)]
                 else:
-                    if "items" in resourcelist:
-                        for item in resourcelist["items"]:
-                            if name is None or item["metadata"]["name"] == name:
-                                yield obj_cls(item, api=self)
-                if (
-                    "metadata" in resourcelist
-                    and "continue" in resourcelist["metadata"]
-                    and resourcelist["metadata"]["continue"]
-                ):
-                    continue_paging = True
-                    params["continue"] = resourcelist["metadata"]["continue"]
+                    items = resourcelist.get("items", [])
+                    if name is not None:
+                        # Filter the page once rather than checking every yielded item
+                        items = [
+                            item for item in items if item["metadata"]["name"] == name
+                        ]
+                    if items:
+                        yield [obj_cls(item, api=self) for item in items]
+                continue_token = resourcelist.get("metadata", {}).get("continue")
+                if continue_token:
+                    # The continue token already pins the resource version of the list
+                    params.pop("resourceVersion", None)
+                    params["continue"] = continue_token
                 else:
                     continue_paging = False
 
@@ -582,19 +704,16 @@ class Api:
                     f"Starting watch of {kind}{' at resourceVersion ' + since if since else ''}"
                 )
                 async for line in response.aiter_lines():
-                    event = json.loads(line)
-                    if (
-                        event["object"]["kind"] == "Status"
-                        and event["object"].get("code") == 410
-                    ):
+                    event = loads_json(line)
+                    raw_obj = event["object"]
+                    if raw_obj["kind"] == "Status" and raw_obj.get("code") == 410:
                         restart_watch = True
                         logger.debug(
                             f"Got 410 Gone: Restarting watch of {kind} at resourceVersion {since}"
                         )
                         break
-                    obj = obj_cls(event["object"], api=self)
-                    since = obj.metadata.resourceVersion
-                    yield event["type"], obj
+                    since = raw_obj["metadata"]["resourceVersion"]
+                    yield event["type"], obj_cls(raw_obj, api=self)
             if not restart_watch:
                 return
 
@@ -604,45 +723,89 @@ class Api:
 
     # Cache for 6 hours because kubectl does
     # https://github.com/kubernetes/cli-runtime/blob/980bedf450ab21617b33d68331786942227fe93a/pkg/genericclioptions/config_flags.go#L297
-    @cached(TTLCache(1, 60 * 60 * 6))
+    @cached(_api_resources_cache)
     async def async_api_resources(self) -> list[dict]:
         """Get the Kubernetes API resources."""
-        resources = []
-        async with self.call_api(method="GET", version="", base="/api") as response:
-            core_api_list = response.json()
+        if self._disk_cache:
+            resources = await self._async_load_discovery_cache()
+            if resources is not None:
+                return resources
+        return await self._async_discover_api_resources()
 
-        for version in core_api_list["versions"]:
-            async with self.call_api(
-                method="GET", version="", base="/api", url=version
-            ) as response:
-                resource = response.json()
-            resources.extend(
-                [
-                    {"version": version, **r}
-                    for r in resource["resources"]
-                    if "/" not in r["name"]
-                ]
-            )
+    async def _async_discover_api_resources(self) -> list[dict]:
+        async with self.call_api(method="GET", version="", base="/api") as response:
+            core_api_list = loads_json(response.content)
         async with self.call_api(method="GET", version="", base="/apis") as response:
-            api_list = response.json()
+            api_list = loads_json(response.content)
+
+        group_versions = [("/api", version) for version in core_api_list["versions"]]
         for api in sorted(api_list["groups"], key=lambda d: d["name"]):
             for api_version in sort_versions(
                 api["versions"], key=lambda x: x["groupVersion"]
             ):
-                version = api_version["groupVersion"]
+                group_versions.append(("/apis", api_version["groupVersion"]))
+
+        # Fetch all group versions concurrently, storing each result (or error) in
+        # its own slot so the resources are returned in the same order as before
+        results: list[list[dict] | Exception] = [[] for _ in group_versions]
+
+        async def get_resources(i: int, base: str, version: str) -> None:
+            try:
                 async with self.call_api(
-                    method="GET", version="", base="/apis", url=version
+                    method="GET", version="", base=base, url=version
                 ) as response:
-                    resource = response.json()
-                resources.extend(
-                    [
-                        {"version": version, **r}
-                        for r in resource["resources"]
-                        if "/" not in r["name"]
-                    ]
-                )
+                    resource = loads_json(response.content)
+                results[i] = [
+                    {"version": version, **r}
+                    for r in resource["resources"]
+                    if "/" not in r["name"]
+                ]
+            except Exception as e:
+                results[i] = e
+
+        async with anyio.create_task_group() as tg:
+            for i, (base, version) in enumerate(group_versions):
+                tg.start_soon(get_resources, i, base, version)
+
+        resources = []
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+            resources.extend(result)
+        if self._disk_cache:
+            await self._async_save_discovery_cache(resources)
         return resources
 
+    def _discovery_cache_path(self) -> anyio.Path:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        cluster = f"{self.auth.server}|{self.auth.active_context}"
+        key = hashlib.sha256(cluster.encode()).hexdigest()
+        return anyio.Path(cache_home, "kr8s", "discovery", key, "api_resources.json")
+
+    async def _async_load_discovery_cache(self) -> list[dict] | None:
+        path = self._discovery_cache_path()
+        try:
+            if time.time() - (await path.stat()).st_mtime > DISCOVERY_CACHE_TTL:
+                return None
+            return loads_json(await path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    async def _async_save_discovery_cache(self, resources: list[dict]) -> None:
+        path = self._discovery_cache_path()
+        data = dumps_json(resources)
+        # Write to a temporary file and move it into place so that other processes
+        # never read a partially written cache
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+        try:
+            await path.parent.mkdir(parents=True, exist_ok=True)
+            await tmp_path.write_bytes(
+                data if isinstance(data, bytes) else data.encode()
+            )
+            await tmp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"Unable to write discovery cache {path}: {e}")
+
     async def api_versions(self) -> AsyncGenerator[str]:
         """Get the Kubernetes API versions."""
         async for version in self.async_api_versions():
@@ -650,12 +813,12 @@ class Api:
 
     async def async_api_versions(self) -> AsyncGenerator[str]:
         async with self.call_api(method="GET", version="", base="/api") as response:
-            core_api_list = response.json()
+            core_api_list = loads_json(response.content)
         for version in core_api_list["versions"]:
             yield version
 
         async with self.call_api(method="GET", version="", base="/apis") as response:
-            api_list = response.json()
+            api_list = loads_json(response.content)
         for group in api_list["groups"]:
             for version in group["versions"]:
                 yield version["groupVersion"]
@@ -677,6 +840,20 @@ class Api:
         self.auth.namespace = value
 
 
+def loads_json(content: bytes | str) -> Any:
+    """Decode a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json(obj: Any) -> bytes | str:
+    """Encode a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"))
+
+
 def hash_kwargs(kwargs: dict):
     key_kwargs = copy.copy(kwargs)
     for key in key_kwargs:
@@ -1,5 +1,6 @@
 # SPDX-FileCopyrightText: Copyright (c) 2024-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
+import copy
 import pathlib
 import typing
 from typing import Any, Optional, Protocol, Union
@@ -11,6 +12,11 @@ import yaml
 from kr8s._data_utils import dict_list_pack, list_dict_unpack
 from kr8s._types import PathType
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
 # TODO Implement set cluster
 # TODO Implement delete cluster
 # TODO Implement set context
@@ -18,6 +24,10 @@ from kr8s._types import PathType
 # TODO Implement set user
 # TODO Implement delete user
 
+# Parsed kubeconfig files keyed by path, along with the mtime and size they had
+# when they were parsed
+_parsed_kubeconfigs: dict[pathlib.Path, tuple[tuple[int, int], dict]] = {}
+
 
 class KubeConfigProtocol(Protocol):
     @property
@@ -244,12 +254,26 @@ class KubeConfig(KubeConfigMixin):
     def __await__(self):
         async def f():
             if not self._raw:
-                async with await anyio.open_file(self.path) as fh:
-                    self._raw = yaml.safe_load(await fh.read())
+                self._raw = await self._load()
             return self
 
         return f().__await__()
 
+    async def _load(self) -> dict:
+        # Every Api creates new KubeConfig objects, so avoid parsing the same
+        # unchanged file again each time
+        stat = await anyio.Path(self.path).stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self.path in _parsed_kubeconfigs:
+            cached_key, raw = _parsed_kubeconfigs[self.path]
+            if cached_key == key:
+                return copy.deepcopy(raw)
+        async with await anyio.open_file(self.path) as fh:
+            raw = yaml.load(await fh.read(), Loader=YamlLoader)
+        _parsed_kubeconfigs[self.path] = (key, raw)
+        # Hand out a copy as the config gets modified in place before saving
+        return copy.deepcopy(raw)
+
     async def save(self, path=None) -> None:
         path = self.path if not path else path
         if not path:
@@ -257,6 +281,7 @@ class KubeConfig(KubeConfigMixin):
         async with self.__write_lock:
             async with await anyio.open_file(path, "w") as fh:
                 await fh.write(yaml.safe_dump(self._raw))
+            _parsed_kubeconfigs.pop(pathlib.Path(path).expanduser(), None)
 
     @property
     def current_context(self) -> str:
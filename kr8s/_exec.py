@@ -79,18 +79,22 @@ class Exec:
                 else:
                     await ws.send_bytes(STDIN_CHANNEL.to_bytes() + self._stdin.read())  # type: ignore
                 await ws.send_bytes(CLOSE_CHANNEL.to_bytes() + STDIN_CHANNEL.to_bytes())  # type: ignore
+            # Collect output chunks and join them once at the end. Appending to bytes
+            # would copy all of the output received so far for every message
+            stdout: list[bytes] = []
+            stderr: list[bytes] = []
             while True:
                 message = await ws.receive_bytes()
                 channel, message = int(message[0]), message[1:]
                 if message:
                     if channel == STDOUT_CHANNEL:
                         if self._capture_output:
-                            self.stdout += message
+                            stdout.append(message)
                         if self._stdout:
                             self._stdout.write(message)
                     elif channel == STDERR_CHANNEL:
                         if self._capture_output:
-                            self.stderr += message
+                            stderr.append(message)
                         if self._stderr:
                             self._stderr.write(message)
                     elif channel == ERROR_CHANNEL:
@@ -113,6 +117,8 @@ class Exec:
                         raise ExecError(
                             f"Unhandled message on channel {channel}: {message}"
                         )
+            self.stdout = b"".join(stdout)
+            self.stderr = b"".join(stderr)
             yield self
 
     async def wait(self) -> CompletedExec:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import contextlib
-import json
 import pathlib
 import re
 import time
@@ -24,7 +23,7 @@ from typing_extensions import Self
 
 import kr8s
 import kr8s.asyncio
-from kr8s._api import Api
+from kr8s._api import Api, dumps_json, loads_json
 from kr8s._async_utils import run_sync
 from kr8s._data_utils import (
     dict_to_selector,
@@ -39,12 +38,22 @@ from kr8s.asyncio.portforward import PortForward as AsyncPortForward
 from kr8s.portforward import LocalPortType
 from kr8s.portforward import PortForward as SyncPortForward
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
 JSONPATH_CONDITION_EXPRESSION = r"jsonpath='{(?P<expression>.*?)}'=(?P<condition>.*)"
 
 
 class APIObject:
     """Base class for Kubernetes objects."""
 
+    # Store the per-instance state in slots so the hot ``raw`` and ``api`` accessors
+    # avoid instance dict lookups. Subclasses don't declare slots so users can still
+    # set arbitrary attributes on their objects.
+    __slots__ = ("_raw", "_api")
+
     version: str
     endpoint: str
     kind: str
@@ -270,9 +279,9 @@ class APIObject:
             else:
                 api = await kr8s.asyncio.api(_asyncio=False)
         namespace = namespace if namespace else api.namespace
-        start = time.time()
+        deadline = time.monotonic() + timeout
         backoff = 0.1
-        while start + timeout > time.time():
+        while time.monotonic() < deadline:
             if name:
                 try:
                     resources = [
@@ -352,9 +361,9 @@ class APIObject:
             version=self.version,
             url=self.endpoint,
             namespace=self.namespace,
-            data=json.dumps(self.raw),
+            data=dumps_json(self.raw),
         ) as resp:
-            self.raw = resp.json()
+            self.raw = loads_json(resp.content)
 
     async def create(self) -> None:
         """Create this object in Kubernetes."""
@@ -402,7 +411,7 @@ class APIObject:
                 version=self.version,
                 url=f"{self.endpoint}/{self.name}",
                 namespace=self.namespace,
-                data=json.dumps(data),
+                data=dumps_json(data),
             ):
                 pass
         except ServerError as e:
@@ -426,7 +435,7 @@ class APIObject:
                 url=f"{self.endpoint}/{self.name}",
                 namespace=self.namespace,
             ) as resp:
-                self.raw = resp.json()
+                self.raw = loads_json(resp.content)
         except ServerError as e:
             if e.response and e.response.status_code == 404:
                 raise NotFoundError(
@@ -456,10 +465,10 @@ class APIObject:
                 version=self.version,
                 url=url,
                 namespace=self.namespace,
-                data=json.dumps(patch),
+                data=dumps_json(patch),
                 headers=headers,
             ) as resp:
-                self.raw = resp.json()
+                self.raw = loads_json(resp.content)
         except ServerError as e:
             if e.response and e.response.status_code == 404:
                 raise NotFoundError(
@@ -1264,8 +1273,14 @@ class Pod(APIObject):
         check: bool = True,
         capture_output: bool = True,
     ):
+        # Watch for the pod to become ready rather than polling the API. Checking
+        # readiness again after the pod is deleted raises NotFoundError.
         while not await self.async_ready():
-            await anyio.sleep(0.1)
+            async for event, _ in self.async_watch():
+                if event == "DELETED" or await self._test_conditions(
+                    ["condition=Ready", "condition=ContainersReady"], mode="all"
+                ):
+                    break
 
         ex = Exec(
             self,
@@ -1998,6 +2013,11 @@ def get_class(
     Raises:
         KeyError: If no object is registered for the given kind and version.
     """
+    if not _asyncio:
+        # The sync classes are registered when kr8s.objects is imported, which
+        # kr8s itself only does lazily
+        import kr8s.objects  # noqa: F401
+
     result = None
     group = None
     if "/" in kind:
@@ -2195,7 +2215,7 @@ async def objects_from_files(
     objects = []
     for file in files:
         with open(file) as f:
-            for doc in yaml.safe_load_all(f):
+            for doc in yaml.load_all(f, Loader=YamlLoader):
                 if doc is not None:
                     obj = object_from_spec(
                         doc, api=api, allow_unknown_type=True, _asyncio=_asyncio
@@ -4,12 +4,25 @@
 
 This module provides an asynchronous API for interacting with a Kubernetes cluster.
 """
+import importlib
+from typing import TYPE_CHECKING
+
 from kr8s._api import Api
 
-from . import objects, portforward
 from ._api import api
 from ._helpers import api_resources, get, version, watch, whoami
 
+if TYPE_CHECKING:
+    from . import objects, portforward
+
+
+def __getattr__(name):
+    # Import objects and port forwarding on first use, see kr8s.__getattr__
+    if name in ("objects", "portforward"):
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "api",
     "api_resources",
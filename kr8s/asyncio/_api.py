@@ -14,6 +14,7 @@ async def api(
     serviceaccount: Optional[str] = None,
     namespace: Optional[str] = None,
     context: Optional[str] = None,
+    disk_cache: Optional[bool] = None,
     _asyncio: bool = True,
 ) -> _AsyncApi:
     """Create a `kr8s.asyncio.Api` object for interacting with the Kubernetes API.
@@ -26,6 +27,8 @@ async def api(
         serviceaccount: The path of a service account to use
         namespace: The namespace to use
         context: The context to use
+        disk_cache: Whether to cache API discovery data on disk between processes.
+            Defaults to False.
 
     Returns:
         kr8s.asyncio.Api: The API object
@@ -56,8 +59,10 @@ async def api(
             and key in _cls._instances[thread_loop_id]
         ):
             return await _cls._instances[thread_loop_id][key]
+        # Only fall back to an existing client when every argument was left unset.
+        # An explicit disk_cache=False still gets a client without a disk cache.
         if (
-            all(k is None for k in kwargs.values())
+            all(v is None for v in kwargs.values())
             and thread_loop_id in _cls._instances
             and list(_cls._instances[thread_loop_id].values())
         ):
@@ -70,4 +75,5 @@ async def api(
         serviceaccount=serviceaccount,
         namespace=namespace,
         context=context,
+        disk_cache=disk_cache,
     )
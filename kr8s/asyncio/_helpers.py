@@ -1,12 +1,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
-from typing import Optional, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
 
 from kr8s._api import Api
-from kr8s._objects import APIObject
 
 from ._api import api as _api
 
+if TYPE_CHECKING:
+    from kr8s._objects import APIObject
+
 
 async def get(
     kind: str,
@@ -1,13 +1,17 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
+import json
+import os
 import queue
 import threading
+import time
 
 import anyio
 import pytest
 
 import kr8s
 import kr8s.asyncio
+from kr8s._api import DISCOVERY_CACHE_TTL
 from kr8s._async_utils import anext
 from kr8s._exceptions import APITimeoutError
 from kr8s.asyncio.objects import Pod, Table
@@ -186,8 +190,7 @@ async def test_get_pods_as_table() -> None:
 async def test_watch_pods(example_pod_spec, ns) -> None:
     pod = await Pod(example_pod_spec)
     await pod.create()
-    while not await pod.ready():
-        await anyio.sleep(0.1)
+    await pod.wait("condition=Ready")
     async for event, obj in kr8s.asyncio.watch("pods", namespace=ns):
         assert event in ["ADDED", "MODIFIED", "DELETED"]
         assert isinstance(obj, Pod)
@@ -328,26 +331,174 @@ async def test_api_resources_cache(caplog: pytest.LogCaptureFixture) -> None:
     assert caplog.text.count('/apis/ "HTTP/1.1 200 OK"') == 1
 
 
+@pytest.fixture
+def discovery_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "kr8s" / "discovery"
+
+
+def discovery_requests(caplog: pytest.LogCaptureFixture) -> int:
+    return caplog.text.count('/apis/ "HTTP/1.1 200 OK"')
+
+
+async def new_api(**kwargs) -> kr8s.asyncio.Api:
+    # Each new client stands in for a new process, skipping the in-memory caches
+    return await kr8s.asyncio.Api(bypass_factory=True, **kwargs)
+
+
+async def test_api_resources_disk_cache(discovery_cache, caplog) -> None:
+    caplog.set_level("INFO")
+    resources = await (await new_api(disk_cache=True)).api_resources()
+    assert discovery_requests(caplog) == 1
+    [path] = discovery_cache.glob("*/api_resources.json")
+    assert json.loads(path.read_text()) == resources
+
+    assert await (await new_api(disk_cache=True)).api_resources() == resources
+    assert discovery_requests(caplog) == 1
+
+
+async def test_api_resources_disk_cache_expired(discovery_cache, caplog) -> None:
+    caplog.set_level("INFO")
+    resources = await (await new_api(disk_cache=True)).api_resources()
+    [path] = discovery_cache.glob("*/api_resources.json")
+    expired = time.time() - DISCOVERY_CACHE_TTL - 1
+    os.utime(path, (expired, expired))
+
+    assert await (await new_api(disk_cache=True)).api_resources() == resources
+    assert discovery_requests(caplog) == 2
+    assert path.stat().st_mtime > expired
+
+
+async def test_api_resources_disk_cache_corrupt(discovery_cache, caplog) -> None:
+    caplog.set_level("INFO")
+    resources = await (await new_api(disk_cache=True)).api_resources()
+    [path] = discovery_cache.glob("*/api_resources.json")
+    path.write_text('[{"name": "po')
+
+    assert await (await new_api(disk_cache=True)).api_resources() == resources
+    assert discovery_requests(caplog) == 2
+    assert json.loads(path.read_text()) == resources
+
+
+async def test_api_resources_disk_cache_missing_kind(discovery_cache, caplog) -> None:
+    caplog.set_level("INFO")
+    resources = await (await new_api(disk_cache=True)).api_resources()
+    [path] = discovery_cache.glob("*/api_resources.json")
+    # Pretend pods were installed after the cache was written
+    path.write_text(json.dumps([r for r in resources if r["name"] != "pods"]))
+
+    api = await new_api(disk_cache=True)
+    assert await api.lookup_kind("pods") == ("pod/v1", "pods", True)
+    assert discovery_requests(caplog) == 2
+    assert "pods" in [r["name"] for r in json.loads(path.read_text())]
+
+    # The refreshed data is kept in memory as well
+    assert await api.lookup_kind("pods") == ("pod/v1", "pods", True)
+    assert discovery_requests(caplog) == 2
+
+
+async def test_api_resources_disk_cache_disabled(discovery_cache) -> None:
+    await (await new_api()).api_resources()
+    assert not discovery_cache.exists()
+
+
+async def test_api_factory_disk_cache(discovery_cache) -> None:
+    api = await kr8s.asyncio.api(disk_cache=True)
+    assert await kr8s.asyncio.api() is api
+    api2 = await kr8s.asyncio.api(disk_cache=False)
+    assert api2 is not api
+    await api2.api_resources()
+    assert not discovery_cache.exists()
+
+
+async def request_timeout(api):
+    # The read timeout that was applied to a request made by this Api
+    async with api.call_api("GET", version="", base="/version") as response:
+        return response.request.extensions["timeout"]["read"]
+
+
 async def test_api_timeout() -> None:
     from httpx import Timeout
 
     api = await kr8s.asyncio.api()
     api.timeout = 10
-    await api.version()
-    assert api._session
-    assert api._session.timeout.read == 10
+    assert await request_timeout(api) == 10
     api.timeout = 20
-    await api.version()
-    assert api._session.timeout.read == 20
+    assert await request_timeout(api) == 20
     api.timeout = Timeout(30)
-    await api.version()
-    assert api._session.timeout.read == 30
+    assert await request_timeout(api) == 30
 
     api.timeout = 0.00001
     with pytest.raises(APITimeoutError):
         await api.version()
 
 
+async def test_api_shared_session() -> None:
+    api = await kr8s.asyncio.api()
+    api2 = await kr8s.asyncio.api(namespace="kube-system")
+    assert api is not api2
+    await api.version()
+    await api2.version()
+    assert api._session is api2._session
+
+    # Timeouts still apply per Api
+    api2.timeout = 0.00001
+    with pytest.raises(APITimeoutError):
+        await api2.version()
+    assert await request_timeout(api) is None
+
+
+async def test_api_shared_session_reauthenticate() -> None:
+    api = await kr8s.asyncio.api()
+    api2 = await kr8s.asyncio.api(namespace="kube-system")
+    await api.version()
+    await api2.version()
+    assert api._session is api2._session
+    session = api._session
+
+    async with api2.call_api(
+        "GET", version="", base="/version", stream=True
+    ) as response:
+        # Replace the session of one Api while the other is mid-request
+        await api.auth.reauthenticate()
+        await api._create_session(replace=True)
+        assert api._session is not session
+        assert not session.is_closed
+        await response.aread()
+    assert "major" in response.json()
+    assert api2._session is session
+    await api2.version()
+
+    # The last Api to let go of the old session closes it
+    await api2._create_session(replace=True)
+    assert api2._session is not session
+    assert session.is_closed
+
+
+async def test_api_concurrent_first_requests(monkeypatch) -> None:
+    api = await kr8s.asyncio.Api(bypass_factory=True)
+    session_key = api._session_key
+    delays = [0, 0.1]
+    sessions = []
+
+    async def slow_session_key(headers):
+        # Reading certificates from disk can let the first request finish creating
+        # its session before the second one gets there
+        await anyio.sleep(delays.pop(0))
+        key = await session_key(headers)
+        if api._session:
+            sessions.append(api._session)
+        return key
+
+    monkeypatch.setattr(api, "_session_key", slow_session_key)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(api.version)
+        tg.start_soon(api.version)
+    assert api._session
+    assert not any(session.is_closed for session in [*sessions, api._session])
+    await api.version()
+
+
 async def test_lookup_kind():
     api = await kr8s.asyncio.api()
 
@@ -176,3 +176,16 @@ async def test_unset(temp_kubeconfig, cls):
     await config.unset(pointer="/contexts/0/context/foo")
     with pytest.raises(JSONPointerKeyError):
         config.get(pointer="/contexts/0/context/foo")
+
+
+async def test_reload_changed_kubeconfig(tmp_path):
+    path = tmp_path / "config"
+    path.write_text(yaml.safe_dump({"current-context": "foo", "contexts": []}))
+    config = await KubeConfig(path)
+    assert config.current_context == "foo"
+    # Changes to one loaded config must not leak into others
+    config._raw["current-context"] = "bar"
+    assert (await KubeConfig(path)).current_context == "foo"
+    # Changes to the file must be picked up
+    path.write_text(yaml.safe_dump({"current-context": "baz", "contexts": []}))
+    assert (await KubeConfig(path)).current_context == "baz"
@@ -1,7 +1,5 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2025, Kr8s Developers (See LICENSE for list)
 # SPDX-License-Identifier: BSD 3-Clause License
-import time
-
 from kr8s.objects import Pod
 
 
@@ -20,8 +18,7 @@ def test_gen_pod(ns):
     assert "app" in pod.labels
     assert "bar" in pod.annotations
     pod.create()
-    while not pod.exists():
-        time.sleep(1)
+    assert pod.exists()
     pod.delete()
 
 
@@ -29,6 +26,5 @@ def test_gen_simple_pod(ns):
     pod = Pod.gen(name="foo", image="nginx")  # Minimum arguments you can pass
     pod.namespace = ns  # We need to set the namespace to avoid collisions in tests
     pod.create()
-    while not pod.exists():
-        time.sleep(1)
+    assert pod.exists()
     pod.delete()
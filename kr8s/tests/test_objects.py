@@ -68,8 +68,7 @@ async def nginx_pod(k8s_cluster, example_pod_spec):
     example_pod_spec["metadata"]["labels"]["app"] = example_pod_spec["metadata"]["name"]
     pod = await Pod(example_pod_spec)
     await pod.create()
-    while not await pod.ready():
-        await anyio.sleep(0.1)
+    await pod.wait("condition=Ready")
     await pod.exec(
         [
             "dd",
@@ -93,8 +92,7 @@ async def ubuntu_pod(k8s_cluster, example_pod_spec, ns):
     example_pod_spec["spec"]["containers"][0]["command"] = ["sleep", "3600"]
     pod = await Pod(example_pod_spec)
     await pod.create()
-    while not await pod.ready():
-        await anyio.sleep(0.1)
+    await pod.wait("condition=Ready")
     yield pod
     await pod.delete()
 
@@ -755,8 +753,7 @@ async def test_service_proxy():
 async def test_pod_logs(example_pod_spec):
     pod = await Pod(example_pod_spec)
     await pod.create()
-    while not await pod.ready():
-        await anyio.sleep(0.1)
+    await pod.wait("condition=Ready")
     log = "\n".join([line async for line in pod.logs(container="pause")])
     assert isinstance(log, str)
     await pod.delete()
@@ -1057,6 +1054,26 @@ async def test_pod_exec(ubuntu_pod):
     assert ex.returncode == 0
 
 
+async def test_pod_exec_deleted_while_waiting(example_pod_spec):
+    # A readiness probe that never passes keeps the exec waiting for the pod
+    example_pod_spec["spec"]["containers"][0]["readinessProbe"] = {
+        "exec": {"command": ["false"]}
+    }
+    pod = await Pod(example_pod_spec)
+    await pod.create()
+
+    async def delete_pod():
+        await anyio.sleep(1)
+        other = await Pod.get(pod.name, namespace=pod.namespace)
+        await other.delete(force=True)
+
+    with anyio.fail_after(60):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(delete_pod)
+            with pytest.raises(NotFoundError):
+                await pod.exec(["date"])
+
+
 async def test_pod_exec_error(ubuntu_pod):
     with pytest.raises(ExecError):
         await ubuntu_pod.exec(["date", "foo"])
@@ -1363,3 +1380,11 @@ async def test_generate_name():
         assert po.metadata.generateName in po.name
     finally:
         await po.delete()
+
+
+def test_apiobject_top_level_import():
+    from kr8s import APIObject
+    from kr8s._objects import APIObject as _APIObject
+
+    assert APIObject is _APIObject
+    assert kr8s.APIObject is _APIObject